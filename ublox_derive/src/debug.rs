@@ -54,7 +54,7 @@ mod debug_only {
         code: impl std::fmt::Display,
     ) -> Result<String, Box<dyn std::error::Error>> {
         use std::{
-            io::Write as _,
+            io::{BufWriter, Write as _},
             process::{Command, Stdio},
         };
         let mut child = Command::new("rustfmt")
@@ -66,13 +66,17 @@ mod debug_only {
 
         {
             let stdin = child.stdin.as_mut().ok_or("Failed to open stdin")?;
-            stdin.write_all(code.to_string().as_bytes())?;
+            // Stream the code into rustfmt instead of rendering it to a String first
+            let mut stdin = BufWriter::new(stdin);
+            write!(stdin, "{code}")?;
+            stdin.flush()?;
         }
 
         let output = child.wait_with_output()?;
 
         if output.status.success() {
-            Ok(String::from_utf8_lossy(&output.stdout).to_string())
+            // Take ownership of the captured bytes instead of copying them
+            Ok(String::from_utf8(output.stdout)?)
         } else {
             Err(format!(
                 "rustfmt failed: {}",
@@ -83,19 +87,24 @@ mod debug_only {
     }
 
     pub(super) fn print_highlighted(code: &str) {
+        use std::sync::OnceLock;
         use syntect::{
             easy::HighlightLines,
             highlighting::{Style, ThemeSet},
             parsing::SyntaxSet,
             util::{as_24_bit_terminal_escaped, LinesWithEndings},
         };
-        let ps = SyntaxSet::load_defaults_newlines();
-        let ts = ThemeSet::load_defaults();
+        // Loading the bundled syntaxes and themes is expensive, do it once
+        // per compiler process rather than for every printed code block
+        static SYNTAX_SET: OnceLock<SyntaxSet> = OnceLock::new();
+        static THEME_SET: OnceLock<ThemeSet> = OnceLock::new();
+        let ps = SYNTAX_SET.get_or_init(SyntaxSet::load_defaults_newlines);
+        let ts = THEME_SET.get_or_init(ThemeSet::load_defaults);
         let syntax = ps.find_syntax_by_extension("rs").unwrap();
         let mut h = HighlightLines::new(syntax, &ts.themes["base16-ocean.dark"]);
 
         for line in LinesWithEndings::from(code) {
-            let ranges: Vec<(Style, &str)> = h.highlight_line(line, &ps).unwrap();
+            let ranges: Vec<(Style, &str)> = h.highlight_line(line, ps).unwrap();
             let escaped = as_24_bit_terminal_escaped(&ranges[..], false);
             print!("{}", escaped);
         }
@@ -1,7 +1,7 @@
 use crate::types::packetflag::PacketFlag;
 use crate::types::recvpackets::RecvPackets;
 use crate::types::{PackDesc, UbxExtendEnum};
-use proc_macro2::TokenStream;
+use proc_macro2::{Span, TokenStream};
 
 use syn::{
     parse::Parse, punctuated::Punctuated, spanned::Spanned, Attribute, Error, Fields, Generics,
@@ -25,6 +25,7 @@ pub fn parse_packet_description(
     let struct_comment = util::extract_item_comment(&attrs)?;
 
     let name = struct_name.to_string();
+    let ident = Ident::new(&name, Span::call_site());
     let fields = util::parse_fields(fields)?;
 
     if let Some(field) = fields
@@ -41,21 +42,22 @@ pub fn parse_packet_description(
 
     let ret = PackDesc {
         name,
+        ident,
         header,
         comment: struct_comment,
         fields,
         generics,
     };
 
-    if ret.header.payload_len.fixed().map(usize::from) == ret.packet_payload_size() {
+    let payload_size = ret.packet_payload_size();
+    if ret.header.payload_len.fixed().map(usize::from) == payload_size {
         Ok(ret)
     } else {
         Err(Error::new(
             main_sp,
             format!(
                 "Calculated packet size ({:?}) doesn't match specified ({:?})",
-                ret.packet_payload_size(),
-                ret.header.payload_len
+                payload_size, ret.header.payload_len
             ),
         ))
     }
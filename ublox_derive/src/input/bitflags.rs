@@ -1,5 +1,4 @@
 use crate::types::{BitFlagsMacro, BitFlagsMacroItem};
-use quote::ToTokens;
 
 use syn::{
     braced, parse::Parse, punctuated::Punctuated, spanned::Spanned, Attribute, Error, Ident, Token,
@@ -14,20 +13,19 @@ pub fn parse_bitflags(mac: syn::ItemMacro) -> syn::Result<BitFlagsMacro> {
 
     let ast: BitFlagsAst = syn::parse2(mac.mac.tokens)?;
 
-    let valid_types: [(Type, u32); 3] = [
-        (syn::parse_quote!(u8), 1),
-        (syn::parse_quote!(u16), 2),
-        (syn::parse_quote!(u32), 4),
-    ];
-    let nbits = if let Some((_ty, size)) = valid_types.iter().find(|x| x.0 == ast.repr_ty) {
+    const VALID_TYPES: [(&str, u32); 3] = [("u8", 1), ("u16", 2), ("u32", 4)];
+    let nbits = if let Some((_name, size)) = VALID_TYPES
+        .iter()
+        .find(|(name, _)| crate::type_is_ident(&ast.repr_ty, name))
+    {
         size * 8
     } else {
         let mut valid_type_names = String::with_capacity(200);
-        for (t, _) in &valid_types {
+        for (name, _) in &VALID_TYPES {
             if !valid_type_names.is_empty() {
                 valid_type_names.push_str(", ");
             }
-            valid_type_names.push_str(&t.into_token_stream().to_string());
+            valid_type_names.push_str(name);
         }
         return Err(Error::new(
             ast.repr_ty.span(),
@@ -6,7 +6,6 @@ use crate::types::{
 };
 use proc_macro2::Span;
 
-use quote::ToTokens as _;
 use syn::{spanned::Spanned, Attribute, Error, Fields, Ident, Type};
 
 use super::{packfieldmap::PackFieldMap, StructFlags};
@@ -185,7 +184,8 @@ pub(super) fn parse_ubx_attr(attrs: &[Attribute], struct_name: &Ident) -> syn::R
 }
 
 pub(super) fn extract_item_comment(attrs: &[Attribute]) -> syn::Result<String> {
-    let mut doc_comments = Vec::new();
+    let mut doc_comments = String::new();
+    let mut first = true;
     for a in attrs {
         if a.path.is_ident("doc") {
             let meta = a.parse_meta()?;
@@ -195,13 +195,17 @@ pub(super) fn extract_item_comment(attrs: &[Attribute]) -> syn::Result<String> {
                         syn::Lit::Str(s) => s,
                         _ => return Err(Error::new(lit.span(), "Invalid comment")),
                     };
-                    doc_comments.push(lit.value());
+                    if !first {
+                        doc_comments.push('\n');
+                    }
+                    first = false;
+                    doc_comments.push_str(&lit.value());
                 },
                 _ => return Err(Error::new(a.span(), "Invalid comments")),
             }
         }
     }
-    Ok(doc_comments.join("\n"))
+    Ok(doc_comments)
 }
 
 pub(super) fn parse_fields(fields: Fields) -> syn::Result<Vec<PackField>> {
@@ -221,6 +225,8 @@ pub(super) fn parse_fields(fields: Fields) -> syn::Result<Vec<PackField>> {
             ..
         } = f;
         let size_bytes = field_size_bytes(&ty)?;
+        // `field_size_bytes` only accepts `[u8; N]` arrays
+        let raw_ty_byte_array = matches!(ty, syn::Type::Array(_));
 
         let name = name.ok_or_else(|| Error::new(f_sp, "No field name"))?;
         let comment = extract_item_comment(&attrs)?;
@@ -254,6 +260,7 @@ pub(super) fn parse_fields(fields: Fields) -> syn::Result<Vec<PackField>> {
             map,
             comment,
             size_bytes,
+            raw_ty_byte_array,
         });
     }
 
@@ -261,20 +268,23 @@ pub(super) fn parse_fields(fields: Fields) -> syn::Result<Vec<PackField>> {
 }
 
 fn field_size_bytes(ty: &Type) -> syn::Result<Option<NonZeroUsize>> {
-    let valid_types: [(Type, NonZeroUsize); 8] = [
-        (syn::parse_quote!(u8), NonZeroUsize::new(1).unwrap()),
-        (syn::parse_quote!(i8), NonZeroUsize::new(1).unwrap()),
-        (syn::parse_quote!(u16), NonZeroUsize::new(2).unwrap()),
-        (syn::parse_quote!(i16), NonZeroUsize::new(2).unwrap()),
-        (syn::parse_quote!(u32), NonZeroUsize::new(4).unwrap()),
-        (syn::parse_quote!(i32), NonZeroUsize::new(4).unwrap()),
-        (syn::parse_quote!(f32), NonZeroUsize::new(4).unwrap()),
-        (syn::parse_quote!(f64), NonZeroUsize::new(8).unwrap()),
+    const VALID_TYPES: [(&str, usize); 8] = [
+        ("u8", 1),
+        ("i8", 1),
+        ("u16", 2),
+        ("i16", 2),
+        ("u32", 4),
+        ("i32", 4),
+        ("f32", 4),
+        ("f64", 8),
     ];
-    if let Some((_ty, size)) = valid_types.iter().find(|x| x.0 == *ty) {
-        Ok(Some(*size))
+    if let Some((_name, size)) = VALID_TYPES
+        .iter()
+        .find(|(name, _)| crate::type_is_ident(ty, name))
+    {
+        Ok(NonZeroUsize::new(*size))
     } else if let syn::Type::Array(fixed_array) = ty {
-        if *fixed_array.elem != syn::parse_quote!(u8) {
+        if !crate::type_is_ident(&fixed_array.elem, "u8") {
             return Err(Error::new(fixed_array.elem.span(), "Only u8 supported"));
         }
         if let syn::Expr::Lit(syn::ExprLit {
@@ -294,11 +304,11 @@ fn field_size_bytes(ty: &Type) -> syn::Result<Option<NonZeroUsize>> {
         Ok(None)
     } else {
         let mut valid_type_names = String::with_capacity(200);
-        for (t, _) in &valid_types {
+        for (name, _) in &VALID_TYPES {
             if !valid_type_names.is_empty() {
                 valid_type_names.push_str(", ");
             }
-            valid_type_names.push_str(&t.into_token_stream().to_string());
+            valid_type_names.push_str(name);
         }
         Err(Error::new(
             ty.span(),
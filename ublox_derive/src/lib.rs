@@ -211,6 +211,11 @@ fn type_is_option(ty: &Type) -> bool {
     matches!(ty, Type::Path(typepath) if typepath.qself.is_none() && path_is_option(&typepath.path))
 }
 
+/// Checks whether `ty` is the plain single-identifier type `name`, e.g. `u8`
+fn type_is_ident(ty: &Type, name: &str) -> bool {
+    matches!(ty, Type::Path(typepath) if typepath.qself.is_none() && typepath.path.is_ident(name))
+}
+
 fn path_is_option(path: &syn::Path) -> bool {
     path.segments.len() == 1 && path.segments.iter().next().unwrap().ident == "Option"
 }
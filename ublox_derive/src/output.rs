@@ -1,10 +1,9 @@
 use crate::debug::DebugContext;
 use crate::types::BitFlagsMacro;
 use crate::types::{PackDesc, PayloadLen, UbxEnumRestHandling, UbxTypeFromFn, UbxTypeIntoFn};
-use proc_macro2::{Span, TokenStream};
+use proc_macro2::TokenStream;
 use quote::{format_ident, quote, ToTokens};
 use std::{collections::HashSet, convert::TryFrom};
-use syn::Ident;
 
 pub(crate) mod extend_enum;
 pub(crate) mod gen_code_for_parse;
@@ -14,7 +13,7 @@ mod match_packet;
 mod util;
 
 pub fn generate_types_for_packet(_dbg_ctx: DebugContext, pack_descr: &PackDesc) -> TokenStream {
-    let name = Ident::new(&pack_descr.name, Span::call_site());
+    let name = &pack_descr.ident;
     let class = pack_descr.header.class;
     let id = pack_descr.header.id;
     let fixed_payload_len = match pack_descr.header.payload_len.fixed() {
@@ -50,38 +49,21 @@ pub fn generate_code_to_extend_bitflags(bitflags: BitFlagsMacro) -> syn::Result<
         Some(UbxEnumRestHandling::Reserved) => (),
     }
 
-    let mut known_flags = HashSet::new();
-    let mut items = Vec::with_capacity(usize::try_from(bitflags.nbits).unwrap());
+    let nbits = usize::try_from(bitflags.nbits).unwrap();
     let repr_ty = &bitflags.repr_ty;
 
-    for bit in 0..bitflags.nbits {
-        let flag_bit = 1u64.checked_shl(bit).unwrap();
-        if let Some(item) = bitflags.consts.iter().find(|x| x.value == flag_bit) {
-            known_flags.insert(flag_bit);
-            let name = &item.name;
-            let attrs = &item.attrs;
-            if bit != 0 {
-                items.push(quote! {
-                    #(#attrs)*
-                    const #name  = ((1 as #repr_ty) << #bit)
-                });
-            } else {
-                items.push(quote! {
-                    #(#attrs)*
-                    const #name  = (1 as #repr_ty)
-                });
-            }
-        } else {
-            let name = format_ident!("RESERVED{}", bit);
-            if bit != 0 {
-                items.push(quote! { const #name = ((1 as #repr_ty) << #bit)});
-            } else {
-                items.push(quote! { const #name = (1 as #repr_ty) });
-            }
+    // Map every bit position to the first user flag defining it, in a single
+    // pass over the flags instead of searching them again for every bit
+    let mut flag_for_bit = vec![None; nbits];
+    for item in &bitflags.consts {
+        if item.value.is_power_of_two() && item.value.trailing_zeros() < bitflags.nbits {
+            flag_for_bit[item.value.trailing_zeros() as usize].get_or_insert(item);
         }
     }
 
-    if known_flags.len() != bitflags.consts.len() {
+    let nknown = flag_for_bit.iter().flatten().count();
+    if nknown != bitflags.consts.len() {
+        let known_flags: HashSet<_> = flag_for_bit.iter().flatten().map(|x| x.value).collect();
         let user_flags: HashSet<_> = bitflags.consts.iter().map(|x| x.value).collect();
         let set = user_flags.difference(&known_flags);
         return Err(syn::Error::new(
@@ -90,6 +72,26 @@ pub fn generate_code_to_extend_bitflags(bitflags: BitFlagsMacro) -> syn::Result<
         ));
     }
 
+    let mut items = Vec::with_capacity(nbits);
+    for (bit, flag) in (0..bitflags.nbits).zip(flag_for_bit) {
+        let value = if bit != 0 {
+            quote! { ((1 as #repr_ty) << #bit) }
+        } else {
+            quote! { (1 as #repr_ty) }
+        };
+        if let Some(item) = flag {
+            let name = &item.name;
+            let attrs = &item.attrs;
+            items.push(quote! {
+                #(#attrs)*
+                const #name  = #value
+            });
+        } else {
+            let name = format_ident!("RESERVED{}", bit);
+            items.push(quote! { const #name = #value });
+        }
+    }
+
     let vis = &bitflags.vis;
     let attrs = &bitflags.attrs;
     let name = &bitflags.name;
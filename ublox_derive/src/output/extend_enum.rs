@@ -1,38 +1,36 @@
 use crate::types::{UbxEnumRestHandling, UbxExtendEnum, UbxTypeFromFn, UbxTypeIntoFn};
 use proc_macro2::TokenStream;
 use quote::{format_ident, quote};
-use std::collections::HashSet;
-use syn::{parse_quote, Type};
 
 pub(crate) fn generate_code_to_extend_enum(ubx_enum: &UbxExtendEnum) -> TokenStream {
-    assert_eq!(ubx_enum.repr, {
-        let ty: Type = parse_quote! { u8 };
-        ty
-    });
+    assert!(crate::type_is_ident(&ubx_enum.repr, "u8"));
     let name = &ubx_enum.name;
     let mut variants = ubx_enum.variants.clone();
     let attrs = &ubx_enum.attrs;
     if let Some(UbxEnumRestHandling::Reserved) = ubx_enum.rest_handling {
-        let defined: HashSet<u8> = ubx_enum.variants.iter().map(|x| x.1).collect();
+        let mut defined = [false; 256];
+        for (_, val) in &ubx_enum.variants {
+            defined[usize::from(*val)] = true;
+        }
         for i in 0..=u8::MAX {
-            if !defined.contains(&i) {
+            if !defined[usize::from(i)] {
                 let name = format_ident!("Reserved{}", i);
                 variants.push((name, i));
             }
         }
     }
     let repr_ty = &ubx_enum.repr;
+    // Same `value => Enum::Variant` arms for both `from` and `from_unchecked`
+    let match_branches: Vec<TokenStream> = variants
+        .iter()
+        .map(|(id, val)| quote! { #val => #name :: #id })
+        .collect();
     let from_code = match ubx_enum.from_fn {
         Some(UbxTypeFromFn::From) => {
             assert_ne!(
                 Some(UbxEnumRestHandling::ErrorProne),
                 ubx_enum.rest_handling
             );
-            let mut match_branches = Vec::with_capacity(variants.len());
-            for (id, val) in &variants {
-                match_branches.push(quote! { #val => #name :: #id });
-            }
-
             quote! {
                 impl #name {
                     fn from(x: #repr_ty) -> Self {
@@ -45,19 +43,7 @@ pub(crate) fn generate_code_to_extend_enum(ubx_enum: &UbxExtendEnum) -> TokenStr
         },
         Some(UbxTypeFromFn::FromUnchecked) => {
             assert_ne!(Some(UbxEnumRestHandling::Reserved), ubx_enum.rest_handling);
-            let mut match_branches = Vec::with_capacity(variants.len());
-            for (id, val) in &variants {
-                match_branches.push(quote! { #val => #name :: #id });
-            }
-
-            let mut values = Vec::with_capacity(variants.len());
-            for (i, (_, val)) in variants.iter().enumerate() {
-                if i != 0 {
-                    values.push(quote! { | #val });
-                } else {
-                    values.push(quote! { #val });
-                }
-            }
+            let values = variants.iter().map(|(_, val)| val);
 
             quote! {
                 impl #name {
@@ -69,7 +55,7 @@ pub(crate) fn generate_code_to_extend_enum(ubx_enum: &UbxExtendEnum) -> TokenStr
                     }
                     fn is_valid(x: #repr_ty) -> bool {
                         match x {
-                            #(#values)* => true,
+                            #(#values)|* => true,
                             _ => false,
                         }
                     }
@@ -91,7 +91,7 @@ fn generate_validator(
     ref_name: &syn::Ident,
     field_validators: Vec<TokenStream>,
 ) -> TokenStream {
-    let validator = if let Some(payload_len) = pack_descr.packet_payload_size() {
+    let validator = if let Some(payload_len) = pack_descr.fixed_payload_size() {
         quote! {
             pub(crate) fn validate(payload: &[u8]) -> Result<(), ParserError> {
                 let expect = #payload_len;
@@ -234,8 +234,9 @@ fn process_fixed_size_field(
     if let Some(ref out_ty) = f.map.map_type {
         let get_raw_name = format_ident!("{}_raw", get_name);
 
-        let slicetype = syn::parse_str("&[u8]").unwrap();
+        let slicetype: syn::Type;
         let raw_ty = if f.is_field_raw_ty_byte_array() {
+            slicetype = parse_quote! { &[u8] };
             &slicetype
         } else {
             &f.ty
@@ -335,7 +336,7 @@ fn process_variable_size_field<'a>(
     } else {
         parse_quote! { &[u8] }
     };
-    let getter_out_ty = remove_lifetimes(out_ty.clone());
+    let getter_out_ty = remove_lifetimes(out_ty);
 
     let getter_def = quote! {
         #[doc = #field_comment]
@@ -355,9 +356,7 @@ fn remove_lifetimes(mut ty: syn::Type) -> syn::Type {
             // Only process angle-bracketed args
             if let syn::PathArguments::AngleBracketed(args) = &mut segment.arguments {
                 // Filter out lifetimes
-                args.args = args
-                    .args
-                    .clone()
+                args.args = std::mem::take(&mut args.args)
                     .into_iter()
                     .filter(|arg| !matches!(arg, syn::GenericArgument::Lifetime(_)))
                     .collect();
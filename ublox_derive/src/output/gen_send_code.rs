@@ -1,12 +1,11 @@
 use crate::debug::DebugContext;
 use crate::types::packetflag::PacketFlag;
 use crate::types::PackDesc;
-use proc_macro2::{Span, TokenStream};
+use proc_macro2::TokenStream;
 use quote::{format_ident, quote};
-use syn::Ident;
 
 pub fn generate_send_code_for_packet(_dbg_ctx: DebugContext, pack_descr: &PackDesc) -> TokenStream {
-    let main_name = Ident::new(&pack_descr.name, Span::call_site());
+    let main_name = &pack_descr.ident;
     let payload_struct = format_ident!("{}Builder", pack_descr.name);
 
     let mut builder_needs_lifetime = false;
@@ -125,7 +124,7 @@ pub fn generate_send_code_for_packet(_dbg_ctx: DebugContext, pack_descr: &PackDe
         }
     };
 
-    if let Some(packet_payload_size) = pack_descr.packet_payload_size() {
+    if let Some(packet_payload_size) = pack_descr.fixed_payload_size() {
         let packet_size = packet_payload_size + 8;
         let packet_payload_size_u16 = u16::try_from(packet_payload_size).unwrap();
         ret.extend(quote! {
@@ -1,7 +1,7 @@
 use crate::types::{packfield::PackField, PackDesc};
 use proc_macro2::TokenStream;
 use quote::quote;
-use syn::{parse_quote, Ident, Type};
+use syn::Ident;
 
 pub(super) fn generate_debug_impl(
     pack_name: &str,
@@ -96,21 +96,23 @@ pub(super) fn get_raw_field_code(
         None => unimplemented!(),
     };
 
-    let mut bytes = Vec::with_capacity(size_bytes.get());
-    for i in 0..size_bytes.get() {
-        let byte_off = cur_off.checked_add(i).unwrap();
-        bytes.push(quote! { #data[#byte_off] });
-    }
+    // Per-byte indexing is only emitted by the array and `from_le_bytes` forms
+    let bytes = || {
+        (0..size_bytes.get()).map(|i| {
+            let byte_off = cur_off.checked_add(i).unwrap();
+            quote! { #data[#byte_off] }
+        })
+    };
     let raw_ty = &field.ty;
 
-    let signed_byte: Type = parse_quote! { i8 };
-
     if field.map.get_as_ref {
         let size_bytes: usize = size_bytes.into();
         quote! { &#data[#cur_off .. (#cur_off + #size_bytes)] }
     } else if field.is_field_raw_ty_byte_array() {
+        let bytes = bytes();
         quote! { [#(#bytes),*] }
-    } else if size_bytes.get() != 1 || *raw_ty == signed_byte {
+    } else if size_bytes.get() != 1 || crate::type_is_ident(raw_ty, "i8") {
+        let bytes = bytes();
         quote! { <#raw_ty>::from_le_bytes([#(#bytes),*]) }
     } else {
         quote! { #data[#cur_off] }
@@ -2,7 +2,7 @@ use packetflag::PacketFlag;
 use packfield::PackField;
 use proc_macro2::TokenStream;
 use quote::quote;
-use syn::{Attribute, Generics, Ident, Lifetime, Type};
+use syn::{Attribute, Generics, Ident, Type};
 
 pub(crate) mod packetflag;
 pub(crate) mod packfield;
@@ -11,6 +11,8 @@ pub(crate) mod recvpackets;
 
 pub struct PackDesc {
     pub name: String,
+    /// `name` as an identifier, created once for all generators
+    pub ident: Ident,
     pub header: PackHeader,
     pub comment: String,
     pub fields: Vec<PackField>,
@@ -23,6 +25,12 @@ impl PackDesc {
         PackDesc::fields_size(self.fields.iter())
     }
 
+    /// Same as [`Self::packet_payload_size`], but taken from the declared
+    /// `fixed_payload_len`, which parsing already checked against the fields
+    pub fn fixed_payload_size(&self) -> Option<usize> {
+        self.header.payload_len.fixed().map(usize::from)
+    }
+
     pub fn packet_payload_size_except_last_field(&self) -> Option<usize> {
         PackDesc::fields_size(self.fields.iter().rev().skip(1))
     }
@@ -32,25 +40,23 @@ impl PackDesc {
     }
 
     fn fields_size<'a, I: Iterator<Item = &'a PackField>>(iter: I) -> Option<usize> {
-        let mut ret: usize = 0;
-        for f in iter {
-            let size = f.size_bytes?;
-            ret = ret
-                .checked_add(size.get())
-                .expect("overflow during packet size calculation");
-        }
-        Some(ret)
+        iter.map(|f| f.size_bytes).try_fold(0usize, |ret, size| {
+            Some(
+                ret.checked_add(size?.get())
+                    .expect("overflow during packet size calculation"),
+            )
+        })
     }
 
     /// Returns lifetimes if the packet has any on the form `<'a, 'b, 'c>`
     pub(crate) fn lifetime_tokens(&self) -> Option<TokenStream> {
-        let lifetimes: Vec<Lifetime> = self
+        let mut lifetimes = self
             .generics
             .lifetimes()
-            .map(|ldef| ldef.lifetime.clone())
-            .collect();
+            .map(|ldef| &ldef.lifetime)
+            .peekable();
 
-        if lifetimes.is_empty() {
+        if lifetimes.peek().is_none() {
             None
         } else {
             // Create a TokenStream with the lifetimes in angle brackets
@@ -11,6 +11,8 @@ pub struct PackField {
     pub map: PackFieldMapDesc,
     pub comment: String,
     pub size_bytes: Option<NonZeroUsize>,
+    /// `true` if the raw type is `[u8; N]`, computed once while parsing
+    pub raw_ty_byte_array: bool,
 }
 
 impl PackField {
@@ -39,10 +41,6 @@ impl PackField {
         self.map.alias.as_ref().unwrap_or(&self.name)
     }
     pub fn is_field_raw_ty_byte_array(&self) -> bool {
-        if let syn::Type::Array(ref fixed_array) = self.ty {
-            *fixed_array.elem == syn::parse_quote!(u8)
-        } else {
-            false
-        }
+        self.raw_ty_byte_array
     }
 }
@@ -41,7 +41,7 @@ impl PackFieldMapDesc {
             });
 
             let into_fn = map_type.into_fn.unwrap_or_else(|| {
-                if ty == syn::parse_quote! {f32} || ty == syn::parse_quote! {f64} {
+                if crate::type_is_ident(&ty, "f32") || crate::type_is_ident(&ty, "f64") {
                     if let Some(scale_back) = scale_back {
                         let conv_method =
                             quote::format_ident!("as_{}", raw_ty.into_token_stream().to_string());